@@ -20,14 +20,58 @@ def test_cli_help(capsys):
 
 @patch("transcriber.main.run_pipeline")
 def test_cli_config_pass_through(mock_run_pipeline):
-    with patch("transcriber.config.Config.load") as mock_load:
+    with patch("transcriber.config.Config.load_all") as mock_load_all:
         mock_config = MagicMock(spec=Config)
         mock_config.vault_root = Path("/test/vault").resolve()
         mock_config.ai_provider = "test_ai"
-        mock_load.return_value = mock_config
+        mock_load_all.return_value = ([mock_config], 1)
 
         with patch.object(sys, "argv", ["transcriber", "--vault-root", "/test/vault", "--ai-provider", "test_ai"]):
-            with patch("os.environ", os.environ.copy()):
+            with patch("os.environ", os.environ.copy()) as environ:
                 main()
+                assert environ["TRANSCRIBER_AI_PROVIDER"] == "test_ai"
 
-    mock_run_pipeline.assert_called_once_with(mock_config)
+    mock_load_all.assert_called_once_with(config_path=None, vault_roots=[Path("/test/vault")])
+    mock_run_pipeline.assert_called_once_with(mock_config, max_concurrency=1)
+
+
+@patch("transcriber.main.run_pipeline")
+def test_cli_single_vault_runs_sequentially(mock_run_pipeline, tmp_path):
+    with patch.object(sys, "argv", ["transcriber", "--config", str(tmp_path / "missing.toml"), "--vault-root", str(tmp_path)]):
+        with patch("os.environ", {}):
+            main()
+
+    config = mock_run_pipeline.call_args.args[0]
+    assert config.vault_root == tmp_path.resolve()
+    assert mock_run_pipeline.call_args.kwargs == {"max_concurrency": 1}
+
+
+@pytest.mark.parametrize("toml_content,env", [
+    ('[[vaults]]\naudio_dir = "Voice"\n', {}),
+    ("", {"TRANSCRIBER_MAX_CONCURRENCY": "abc"}),
+])
+def test_cli_reports_config_errors(tmp_path, capsys, toml_content, env):
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text(toml_content)
+
+    with patch.object(sys, "argv", ["transcriber", "--config", str(config_file)]):
+        with patch("os.environ", env):
+            with pytest.raises(SystemExit) as e:
+                main()
+
+    assert e.value.code == 1
+    assert capsys.readouterr().out.startswith("Error: ")
+
+
+@patch("transcriber.main.print_summary")
+@patch("transcriber.main.run_vaults")
+def test_cli_multiple_vault_roots(mock_run_vaults, mock_print_summary):
+    mock_run_vaults.return_value = []
+    with patch.object(sys, "argv", ["transcriber", "--vault-root", "/a", "--vault-root", "/b", "--max-concurrency", "3"]):
+        with patch("os.environ", os.environ.copy()):
+            main()
+
+    configs = mock_run_vaults.call_args.args[0]
+    assert [c.vault_root for c in configs] == [Path("/a").resolve(), Path("/b").resolve()]
+    assert mock_run_vaults.call_args.kwargs == {"max_concurrency": 3}
+    mock_print_summary.assert_called_once_with([])
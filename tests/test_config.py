@@ -93,3 +93,108 @@ def test_relative_paths_resolve_under_vault(tmp_path):
 
     assert config.get_audio_path() == vault / "Inside" / "Audio"
     assert config.get_transcription_path() == vault / "Inside" / "Trans"
+
+
+def test_load_all_from_vault_tables(tmp_path):
+    toml_content = """\
+audio_dir = "Shared"
+ai_model = "base-model"
+
+[[vaults]]
+vault_root = "/vaults/one"
+
+[[vaults]]
+vault_root = "/vaults/two"
+audio_dir = "Voice"
+"""
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text(toml_content)
+
+    configs, max_concurrency = Config.load_all(config_path=config_file)
+
+    assert [c.vault_root for c in configs] == [Path("/vaults/one").resolve(), Path("/vaults/two").resolve()]
+    assert max_concurrency == 4
+    assert [c.audio_dir for c in configs] == [Path("Shared"), Path("Voice")]
+    assert all(c.ai_model == "base-model" for c in configs)
+
+
+def test_load_all_vault_roots_replace_tables(tmp_path):
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text('[[vaults]]\nvault_root = "/vaults/one"\n')
+
+    configs, _ = Config.load_all(config_path=config_file, vault_roots=[Path("/a"), Path("/b")])
+
+    assert [c.vault_root for c in configs] == [Path("/a").resolve(), Path("/b").resolve()]
+
+
+def test_load_all_without_vaults_matches_load(tmp_path):
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text('vault_root = "/toml/vault"\n')
+
+    configs, max_concurrency = Config.load_all(config_path=config_file)
+
+    assert configs == [Config.load(config_path=config_file)]
+    assert max_concurrency == 1
+
+
+def test_load_all_requires_vault_root(tmp_path):
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text('[[vaults]]\naudio_dir = "Voice"\n')
+
+    with pytest.raises(ValueError, match="Each \\[\\[vaults\\]\\] entry must set vault_root"):
+        Config.load_all(config_path=config_file)
+
+
+def test_load_all_deduplicates_vault_roots(tmp_path):
+    configs, _ = Config.load_all(config_path=tmp_path / "missing.toml", vault_roots=[tmp_path, tmp_path / ".", tmp_path / "other"])
+
+    assert [c.vault_root for c in configs] == [tmp_path.resolve(), (tmp_path / "other").resolve()]
+
+
+def test_load_all_warns_about_vault_root_env(monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("TRANSCRIBER_VAULT_ROOT", "/env/vault")
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text('[[vaults]]\nvault_root = "/vaults/one"\n')
+
+    configs, _ = Config.load_all(config_path=config_file)
+
+    assert [c.vault_root for c in configs] == [Path("/vaults/one").resolve()]
+    assert "TRANSCRIBER_VAULT_ROOT is ignored" in capsys.readouterr().out
+
+
+def test_max_concurrency_is_run_wide(tmp_path, capsys):
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text('max_concurrency = 8\n\n[[vaults]]\nvault_root = "/vaults/one"\nmax_concurrency = 1\n')
+
+    _, max_concurrency = Config.load_all(config_path=config_file)
+
+    assert max_concurrency == 8
+    assert "max_concurrency applies to the whole run" in capsys.readouterr().out
+
+
+def test_max_concurrency_env_priority(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRANSCRIBER_MAX_CONCURRENCY", "3")
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text("max_concurrency = 8\n")
+
+    assert Config.load_all(config_path=config_file)[1] == 3
+
+
+@pytest.mark.parametrize("value,message", [
+    ("0", "at least 1"),
+    ("-2", "at least 1"),
+    ("abc", "must be an integer"),
+])
+def test_max_concurrency_rejects_invalid(monkeypatch, tmp_path, value, message):
+    monkeypatch.setenv("TRANSCRIBER_MAX_CONCURRENCY", value)
+
+    with pytest.raises(ValueError, match=message):
+        Config.load_all(config_path=tmp_path / "missing.toml")
+
+
+def test_load_all_rejects_non_table_vaults(tmp_path):
+    config_file = tmp_path / "transcriber.toml"
+    config_file.write_text('vaults = ["a"]\n')
+
+    with pytest.raises(ValueError, match="list of \\[\\[vaults\\]\\] tables"):
+        Config.load_all(config_path=config_file)
@@ -1,7 +1,11 @@
+import os
+import time
+import signal
+import threading
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
-from transcriber.main import run_pipeline, log_error
+from transcriber.main import run_pipeline, run_vaults, log_error
 from transcriber.config import Config
 
 
@@ -44,6 +48,198 @@ def test_run_pipeline_skips_existing(mock_organizer, mock_factory, mock_linker,
     mock_trans.transcribe.assert_not_called()
 
 
+@patch("transcriber.main.factory")
+@patch("transcriber.main.FileOrganizer")
+def test_run_pipeline_unknown_provider_organizes_then_exits(mock_organizer, mock_factory, tmp_path):
+    mock_factory.get_provider.side_effect = ValueError("Unknown provider: nope")
+    config = Config(vault_root=tmp_path, api_key="test_key", ai_provider="nope")
+
+    with pytest.raises(SystemExit) as e:
+        run_pipeline(config)
+
+    assert e.value.code == 1
+    mock_organizer.return_value.organize.assert_called_once()
+    assert "Unknown provider: nope" in (tmp_path / "Transcription Errors.md").read_text()
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+def test_run_vaults_shares_provider(mock_factory, mock_linker, tmp_path):
+    configs = []
+    for name in ("one", "two"):
+        vault = tmp_path / name
+        (vault / "Recordings").mkdir(parents=True)
+        (vault / "Recordings" / f"{name}.m4a").write_text("audio")
+        configs.append(Config(vault_root=vault, api_key="test_key"))
+    (tmp_path / "two" / "Recordings" / "two-transcribe.md").write_text("transcription")
+    mock_factory.get_provider.return_value.transcribe.return_value = "Transcribed text"
+
+    results = run_vaults(configs, max_concurrency=2)
+
+    mock_factory.get_provider.assert_called_once_with("mistral", "test_key", timeout=300.0)
+    assert [(r.transcribed, r.skipped, r.failed) for r in results] == [(1, 0, 0), (0, 1, 0)]
+    assert (tmp_path / "one" / "Recordings" / "one-transcribe.md").read_text() == "Transcribed text"
+    assert mock_linker.return_value.migrate_all.call_count == 2
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+def test_run_vaults_isolates_failing_vault(mock_factory, mock_linker, tmp_path):
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    good = tmp_path / "good"
+    (good / "Recordings").mkdir(parents=True)
+    (good / "Recordings" / "note.m4a").write_text("audio")
+    mock_factory.get_provider.return_value.transcribe.return_value = "Transcribed text"
+
+    results = run_vaults([Config(vault_root=broken), Config(vault_root=good, api_key="test_key")])
+
+    assert results[0].error == "API Key not found for provider mistral."
+    assert (broken / "Transcription Errors.md").exists()
+    assert results[1].error is None
+    assert results[1].transcribed == 1
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+def test_run_vaults_survives_missing_vault(mock_factory, mock_linker, tmp_path):
+    good = tmp_path / "good"
+    (good / "Recordings").mkdir(parents=True)
+    (good / "Recordings" / "note.m4a").write_text("audio")
+    mock_factory.get_provider.return_value.transcribe.return_value = "Transcribed text"
+
+    missing = tmp_path / "missing"
+
+    results = run_vaults([Config(vault_root=missing, api_key="test_key"), Config(vault_root=good, api_key="test_key")])
+
+    assert results[0].error == f"Vault root {missing} not found."
+    assert not missing.exists()
+    assert results[1].transcribed == 1
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+@patch("transcriber.main.FileOrganizer")
+def test_run_vaults_isolates_organize_failure(mock_organizer, mock_factory, mock_linker, tmp_path):
+    def make_organizer(vault_root, config, context):
+        organizer = MagicMock()
+        if vault_root.name == "broken":
+            organizer.organize.side_effect = PermissionError("denied")
+        return organizer
+
+    mock_organizer.side_effect = make_organizer
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    good = tmp_path / "good"
+    (good / "Recordings").mkdir(parents=True)
+    (good / "Recordings" / "note.m4a").write_text("audio")
+    mock_factory.get_provider.return_value.transcribe.return_value = "Transcribed text"
+
+    results = run_vaults([Config(vault_root=broken, api_key="k"), Config(vault_root=good, api_key="k")])
+
+    assert results[0].error == "Failed to prepare vault: denied"
+    assert "denied" in (broken / "Transcription Errors.md").read_text()
+    assert results[1].error is None
+    assert results[1].transcribed == 1
+    mock_linker.assert_called_once()
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+def test_run_vaults_isolates_migrate_failure(mock_factory, mock_linker, tmp_path):
+    mock_linker.return_value.migrate_all.side_effect = [OSError("disk full"), None]
+    first = tmp_path / "first"
+    first.mkdir()
+    second = tmp_path / "second"
+    second.mkdir()
+
+    results = run_vaults([Config(vault_root=first, api_key="k"), Config(vault_root=second, api_key="k")])
+
+    assert results[0].error == "Failed to migrate links: disk full"
+    assert results[1].error is None
+    assert mock_linker.return_value.migrate_all.call_count == 2
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+def test_run_vaults_interleaves_vaults(mock_factory, mock_linker, tmp_path):
+    configs = []
+    for name, count in (("a", 3), ("b", 1)):
+        vault = tmp_path / name
+        (vault / "Recordings").mkdir(parents=True)
+        for i in range(count):
+            (vault / "Recordings" / f"{name}{i}.m4a").write_text("audio")
+        configs.append(Config(vault_root=vault, api_key="test_key"))
+    order = []
+    mock_factory.get_provider.return_value.transcribe.side_effect = lambda path, model: order.append(path.name) or "text"
+
+    run_vaults(configs, max_concurrency=1)
+
+    assert order == ["a0.m4a", "b0.m4a", "a1.m4a", "a2.m4a"]
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+def test_run_vaults_bounds_concurrency(mock_factory, mock_linker, tmp_path):
+    configs = []
+    for name in ("a", "b"):
+        vault = tmp_path / name
+        (vault / "Recordings").mkdir(parents=True)
+        for i in range(4):
+            (vault / "Recordings" / f"{name}{i}.m4a").write_text("audio")
+        configs.append(Config(vault_root=vault, api_key="test_key"))
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def transcribe(path, model):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return "text"
+
+    mock_factory.get_provider.return_value.transcribe.side_effect = transcribe
+
+    results = run_vaults(configs, max_concurrency=2)
+
+    assert peak == 2
+    assert [r.transcribed for r in results] == [4, 4]
+    mock_factory.get_provider.return_value.close.assert_called_once()
+
+
+@patch("transcriber.main.LinkMigrator")
+@patch("transcriber.main.factory")
+def test_run_vaults_interrupt_cancels_pending_jobs(mock_factory, mock_linker, tmp_path):
+    vault = tmp_path / "vault"
+    (vault / "Recordings").mkdir(parents=True)
+    for i in range(5):
+        (vault / "Recordings" / f"note{i}.m4a").write_text("audio")
+
+    interrupted = threading.Event()
+
+    def transcribe(path, model):
+        if not interrupted.is_set():
+            interrupted.set()
+            os.kill(os.getpid(), signal.SIGINT)
+        time.sleep(0.2)
+        return "text"
+
+    mock_transcribe = mock_factory.get_provider.return_value.transcribe
+    mock_transcribe.side_effect = transcribe
+
+    with pytest.raises(KeyboardInterrupt):
+        run_vaults([Config(vault_root=vault, api_key="test_key")], max_concurrency=1)
+    time.sleep(0.4)
+
+    assert mock_transcribe.call_count == 1
+    mock_linker.assert_not_called()
+
+
 @patch("transcriber.main.datetime")
 def test_log_error(mock_datetime, tmp_path):
     mock_datetime.now.return_value.strftime.return_value = "2026-02-15 20:00:00"
@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
-from transcriber.providers import TranscriptionProvider, ProviderFactory
+from unittest.mock import patch
+from transcriber.providers import TranscriptionProvider, ProviderFactory, MistralProvider
 
 
 class MockProvider(TranscriptionProvider):
@@ -23,3 +24,19 @@ def test_provider_factory_unknown():
     factory = ProviderFactory()
     with pytest.raises(ValueError, match="Unknown provider: unknown"):
         factory.get_provider("unknown", "key")
+
+
+def test_mistral_provider_reuses_client(tmp_path):
+    audio = tmp_path / "note.m4a"
+    audio.write_text("audio")
+    provider = MistralProvider(api_key="key")
+
+    with patch("transcriber.providers.httpx.Client") as mock_client_cls:
+        mock_client_cls.return_value.post.return_value.json.return_value = {"text": "hello"}
+        assert provider.transcribe(audio, model="m") == "hello"
+        assert provider.transcribe(audio, model="m") == "hello"
+        provider.close()
+
+    mock_client_cls.assert_called_once_with(timeout=300.0)
+    assert mock_client_cls.return_value.post.call_count == 2
+    mock_client_cls.return_value.close.assert_called_once()
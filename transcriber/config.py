@@ -26,6 +26,63 @@ class Config:
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "Config":
         """Loads configuration from TOML file and environment variables (env takes precedence)."""
+        return cls._from_data(cls._read_toml(config_path))
+
+    @classmethod
+    def load_all(cls, config_path: Optional[Path] = None, vault_roots: Optional[list[Path]] = None) -> tuple[list["Config"], int]:
+        """Loads one configuration per vault plus the run-wide concurrency limit.
+
+        Vaults come from ``vault_roots`` if given, otherwise from the ``[[vaults]]``
+        tables in the TOML file. Each ``[[vaults]]`` table overrides the top-level
+        settings for that vault. Without any vaults a single configuration is
+        loaded as in ``load``. Raises ValueError on invalid vault or concurrency
+        settings.
+        """
+        toml_data = cls._read_toml(config_path)
+        vaults = toml_data.pop("vaults", [])
+        if not isinstance(vaults, list) or not all(isinstance(vault, dict) for vault in vaults):
+            raise ValueError("vaults must be a list of [[vaults]] tables")
+
+        if vault_roots:
+            vaults = [{"vault_root": str(root)} for root in vault_roots]
+        elif vaults and os.getenv("TRANSCRIBER_VAULT_ROOT") is not None:
+            print("Warning: TRANSCRIBER_VAULT_ROOT is ignored when [[vaults]] are configured.")
+
+        configs = []
+        seen_roots = set()
+        for vault in vaults:
+            if "vault_root" not in vault:
+                raise ValueError("Each [[vaults]] entry must set vault_root")
+            if "max_concurrency" in vault:
+                print(f"Warning: max_concurrency applies to the whole run and is ignored in [[vaults]] entry {vault['vault_root']}.")
+
+            config = cls._from_data({**toml_data, **vault}, vault_root=vault["vault_root"])
+            if config.vault_root in seen_roots:
+                print(f"Warning: Skipping duplicate vault {config.vault_root}.")
+                continue
+            seen_roots.add(config.vault_root)
+            configs.append(config)
+
+        if not configs:
+            configs = [cls._from_data(toml_data)]
+
+        return configs, cls._max_concurrency(toml_data, default=1 if len(configs) == 1 else 4)
+
+    @staticmethod
+    def _max_concurrency(toml_data: dict, default: int) -> int:
+        val = os.getenv("TRANSCRIBER_MAX_CONCURRENCY")
+        if val is None:
+            val = toml_data.get("max_concurrency", default)
+        try:
+            max_concurrency = int(val)
+        except (TypeError, ValueError):
+            raise ValueError(f"max_concurrency must be an integer, got {val!r}") from None
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        return max_concurrency
+
+    @staticmethod
+    def _read_toml(config_path: Optional[Path]) -> dict:
         toml_data = {}
 
         if config_path is None:
@@ -46,6 +103,10 @@ class Config:
             except Exception as e:
                 print(f"Warning: Could not load config from {config_path}: {e}")
 
+        return toml_data
+
+    @classmethod
+    def _from_data(cls, toml_data: dict, vault_root: Optional[str] = None) -> "Config":
         def get_val(key: str, env_name: str, default):
             val = os.getenv(env_name)
             if val is not None:
@@ -54,7 +115,9 @@ class Config:
                 return val
             return toml_data.get(key, default)
 
-        vault_root = Path(get_val("vault_root", "TRANSCRIBER_VAULT_ROOT", "..")).resolve()
+        if vault_root is None:
+            vault_root = get_val("vault_root", "TRANSCRIBER_VAULT_ROOT", "..")
+        vault_root = Path(vault_root).resolve()
 
         return cls(
             vault_root=vault_root,
@@ -68,7 +131,7 @@ class Config:
             error_log_file=get_val("error_log_file", "TRANSCRIBER_ERROR_LOG", "Transcription Errors.md"),
             migrate_links=get_val("migrate_links", "TRANSCRIBER_MIGRATE_LINKS", True),
             commit_message_template=get_val("commit_message_template", "TRANSCRIBER_COMMIT_MSG", "chore(transcription): Add transcription for {audio_file}"),
-            pr_title_template=get_val("pr_title_template", "TRANSCRIBER_PR_TITLE", "Transcription: {audio_file}")
+            pr_title_template=get_val("pr_title_template", "TRANSCRIBER_PR_TITLE", "Transcription: {audio_file}"),
             )
 
     @classmethod
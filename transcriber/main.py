@@ -2,13 +2,17 @@ import os
 import sys
 import json
 import argparse
+import threading
 from pathlib import Path
 from datetime import datetime
+from itertools import chain, zip_longest
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dotenv import load_dotenv
 
 from transcriber.organizer import FileOrganizer
-from transcriber.providers import factory
+from transcriber.providers import factory, TranscriptionProvider
 from transcriber.linker import LinkMigrator
 from transcriber.config import Config
 
@@ -43,65 +47,198 @@ class VaultContext:
         return any(relative_path.startswith(f.rstrip("/")) for f in self.ignore_filters)
 
 
+_error_log_lock = threading.Lock()
+
+
 def log_error(config: Config, message: str):
     error_file = config.vault_root / config.error_log_file
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(error_file, "a", encoding="utf-8") as f:
+    with _error_log_lock, open(error_file, "a", encoding="utf-8") as f:
         f.write(f"## {timestamp}\n{message}\n\n")
 
 
-def run_pipeline(config: Config):
-    """Runs the full transcription and migration pipeline."""
+def _log_error_safely(config: Config, message: str):
+    try:
+        log_error(config, message)
+    except Exception as e:
+        print(f"Warning: Could not write to error log in {config.vault_root}: {e}")
+
+
+@dataclass
+class VaultResult:
+    """Per-vault outcome of a pipeline run."""
+
+    vault_root: Path
+    transcribed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class TranscriptionJob:
+    """A single recording waiting to be transcribed."""
+
+    config: Config
+    transcriber: TranscriptionProvider
+    audio_file: Path
+    transcription_file: Path
+    result: VaultResult
+
+
+class ProviderPool:
+    """Shares provider instances, and their HTTP clients, between vaults with the same provider settings."""
+
+    def __init__(self):
+        self._providers: dict[tuple, TranscriptionProvider] = {}
+
+    def get(self, config: Config) -> TranscriptionProvider:
+        key = (config.ai_provider.lower(), config.api_key, config.timeout)
+        if key not in self._providers:
+            self._providers[key] = factory.get_provider(config.ai_provider, config.api_key, timeout=config.timeout)
+        return self._providers[key]
+
+    def close(self) -> None:
+        for provider in self._providers.values():
+            provider.close()
+        self._providers.clear()
+
+
+def _prepare_vault(config: Config, context: VaultContext, pool: ProviderPool, result: VaultResult) -> list[TranscriptionJob]:
+    """Organizes a vault and returns its pending transcription jobs."""
     vault_root = config.vault_root
-    context = VaultContext(vault_root)
+
+    if not vault_root.is_dir():
+        result.error = f"Vault root {vault_root} not found."
+        return []
 
     if not config.api_key:
-        error_msg = f"API Key not found for provider {config.ai_provider}."
-        print(f"Error: {error_msg}")
-        log_error(config, error_msg)
-        sys.exit(1)
+        result.error = f"API Key not found for provider {config.ai_provider}."
+        return []
 
-    print("Organizing files...")
+    print(f"Organizing files in {vault_root}...")
     organizer = FileOrganizer(vault_root, config=config, context=context)
     organizer.organize()
 
-    print("Transcribing recordings...")
     try:
-        transcriber = factory.get_provider(config.ai_provider, config.api_key, timeout=config.timeout)
+        transcriber = pool.get(config)
     except ValueError as e:
-        error_msg = str(e)
-        print(f"Error: {error_msg}")
-        log_error(config, error_msg)
-        sys.exit(1)
+        result.error = str(e)
+        return []
 
     audio_dir = config.get_audio_path()
     transcription_dir = config.get_transcription_path()
 
     if not audio_dir.exists():
         print(f"Audio directory {audio_dir} not found. Skipping transcription.")
-    else:
-        for audio_file in audio_dir.glob("*.m4a"):
-            if context.should_ignore(audio_file):
-                continue
-
-            transcription_filename = config.get_transcription_filename(audio_file.name)
-            transcription_file = transcription_dir / transcription_filename
-
-            if not transcription_file.exists():
-                print(f"Transcribing {audio_file.name}...")
-                try:
-                    text = transcriber.transcribe(audio_file, model=config.ai_model)
-                    transcription_file.write_text(text, encoding="utf-8")
-                    print(f"Saved to {transcription_file}")
-                except Exception as e:
-                    error_msg = f"Failed to transcribe {audio_file.name}: {e}"
-                    print(error_msg)
-                    log_error(config, error_msg)
-
-    if config.migrate_links:
-        print("Migrating links...")
-        linker = LinkMigrator(vault_root, config=config, context=context)
-        linker.migrate_all()
+        return []
+
+    jobs = []
+    for audio_file in sorted(audio_dir.glob("*.m4a")):
+        if context.should_ignore(audio_file):
+            continue
+
+        transcription_filename = config.get_transcription_filename(audio_file.name)
+        transcription_file = transcription_dir / transcription_filename
+
+        if transcription_file.exists():
+            result.skipped += 1
+        else:
+            jobs.append(TranscriptionJob(config, transcriber, audio_file, transcription_file, result))
+    return jobs
+
+
+def _transcribe(job: TranscriptionJob) -> bool:
+    print(f"Transcribing {job.audio_file.name} in {job.config.vault_root}...")
+    try:
+        text = job.transcriber.transcribe(job.audio_file, model=job.config.ai_model)
+        job.transcription_file.write_text(text, encoding="utf-8")
+        print(f"Saved to {job.transcription_file}")
+        return True
+    except Exception as e:
+        error_msg = f"Failed to transcribe {job.audio_file.name} in {job.config.vault_root}: {e}"
+        print(error_msg)
+        _log_error_safely(job.config, error_msg)
+        return False
+
+
+def run_vaults(configs: list[Config], max_concurrency: int = 4) -> list[VaultResult]:
+    """Runs the pipeline over several vaults with one provider pool and one concurrency limit.
+
+    A failure in one vault is recorded in its result and does not stop the others.
+    """
+    pool = ProviderPool()
+    results = [VaultResult(vault_root=config.vault_root) for config in configs]
+    contexts: list[Optional[VaultContext]] = []
+
+    job_lists = []
+    for config, result in zip(configs, results):
+        try:
+            context = VaultContext(config.vault_root)
+            job_lists.append(_prepare_vault(config, context, pool, result))
+            contexts.append(context)
+        except Exception as e:
+            result.error = f"Failed to prepare vault: {e}"
+            job_lists.append([])
+            contexts.append(None)
+        if result.error:
+            print(f"Error: {result.error}")
+            _log_error_safely(config, result.error)
+
+    try:
+        # Interleave vaults round-robin so that one large vault does not starve the others.
+        jobs = [job for job in chain.from_iterable(zip_longest(*job_lists)) if job is not None]
+        if jobs:
+            print(f"Transcribing {len(jobs)} recording(s)...")
+            # Managed explicitly: leaving a ``with`` block would wait for every queued
+            # job, so an interrupt could not stop the remaining API calls.
+            executor = ThreadPoolExecutor(max_workers=max_concurrency)
+            try:
+                futures = [(executor.submit(_transcribe, job), job.result) for job in jobs]
+                for future, result in futures:
+                    if future.result():
+                        result.transcribed += 1
+                    else:
+                        result.failed += 1
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+    finally:
+        pool.close()
+
+    for config, context, result in zip(configs, contexts, results):
+        if not config.migrate_links or result.error:
+            continue
+        print(f"Migrating links in {config.vault_root}...")
+        try:
+            linker = LinkMigrator(config.vault_root, config=config, context=context)
+            linker.migrate_all()
+        except Exception as e:
+            result.error = f"Failed to migrate links: {e}"
+            print(f"Error: {result.error}")
+            _log_error_safely(config, result.error)
+
+    return results
+
+
+def print_summary(results: list[VaultResult]):
+    print("Summary:")
+    for result in results:
+        line = (
+            f"  {result.vault_root}: {result.transcribed} transcribed, "
+            f"{result.skipped} skipped, {result.failed} failed"
+        )
+        if result.error:
+            line += f", error: {result.error}"
+        print(line)
+
+
+def run_pipeline(config: Config, max_concurrency: int = 1):
+    """Runs the full transcription and migration pipeline."""
+    result = run_vaults([config], max_concurrency=max_concurrency)[0]
+    if result.error:
+        sys.exit(1)
 
     print("Pipeline completed successfully.")
 
@@ -109,29 +246,43 @@ def run_pipeline(config: Config):
 def main():
     parser = argparse.ArgumentParser(description="Obsidian AV Transcriber CLI")
     parser.add_argument("--config", type=Path, help="Path to transcriber.toml config file")
-    parser.add_argument("--vault-root", type=Path, help="Path to Obsidian vault root")
+    parser.add_argument("--vault-root", type=Path, action="append",
+                        help="Path to Obsidian vault root (repeat to process several vaults)")
     parser.add_argument("--audio-dir", type=Path, help="Directory containing audio files")
     parser.add_argument("--transcription-dir", type=Path, help="Directory for transcriptions")
     parser.add_argument("--ai-provider", help="AI provider (default: mistral)")
     parser.add_argument("--ai-model", help="AI Model to use")
+    parser.add_argument("--max-concurrency", type=int, help="Maximum parallel transcriptions across all vaults")
 
     args = parser.parse_args()
     load_dotenv()
 
     cli_to_env = {
-        "vault_root": "TRANSCRIBER_VAULT_ROOT",
         "audio_dir": "TRANSCRIBER_AUDIO_DIR",
         "transcription_dir": "TRANSCRIBER_TRANSCRIPTION_DIR",
         "ai_provider": "TRANSCRIBER_AI_PROVIDER",
         "ai_model": "TRANSCRIBER_AI_MODEL",
+        "max_concurrency": "TRANSCRIBER_MAX_CONCURRENCY",
     }
     for attr, env_var in cli_to_env.items():
         val = getattr(args, attr)
         if val is not None:
             os.environ[env_var] = str(val)
 
-    config = Config.load(config_path=args.config)
-    run_pipeline(config)
+    try:
+        configs, max_concurrency = Config.load_all(config_path=args.config, vault_roots=args.vault_root)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if len(configs) == 1:
+        run_pipeline(configs[0], max_concurrency=max_concurrency)
+        return
+
+    results = run_vaults(configs, max_concurrency=max_concurrency)
+    print_summary(results)
+    if any(result.error for result in results):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
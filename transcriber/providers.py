@@ -1,4 +1,5 @@
 import httpx
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -14,29 +15,50 @@ class TranscriptionProvider(ABC):
         """Transcribes the given audio file and returns the text."""
         pass
 
+    def close(self) -> None:
+        """Releases any resources held by the provider."""
+        pass
+
 class MistralProvider(TranscriptionProvider):
     """Mistral AI transcription provider."""
 
     API_URL = "https://api.mistral.ai/v1/audio/transcriptions"
 
+    def __init__(self, api_key: str, timeout: float = 300.0, **kwargs):
+        super().__init__(api_key, timeout=timeout, **kwargs)
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Returns the provider's HTTP client, shared by all threads using this provider."""
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(timeout=self.timeout)
+            return self._client
+
     def transcribe(self, audio_path: Path, model: str) -> str:
         with open(audio_path, "rb") as audio_file:
             files = {"file": (audio_path.name, audio_file, "audio/mpeg")}
             headers = {"x-api-key": self.api_key}
 
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    self.API_URL,
-                    headers=headers,
-                    files=files,
-                    data={"model": model}
-                )
-                try:
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as e:
-                    raise Exception(f"{e}. Response: {response.text}") from e
-
-                return response.json()["text"]
+            response = self._get_client().post(
+                self.API_URL,
+                headers=headers,
+                files=files,
+                data={"model": model}
+            )
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise Exception(f"{e}. Response: {response.text}") from e
+
+            return response.json()["text"]
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
 
 class ProviderFactory:
     """Factory for creating transcription providers."""